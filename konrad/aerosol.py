@@ -30,12 +30,167 @@ More input files for radiative properties of aerosols are available at #TODO
 
 import os
 import abc
+import functools
 import xarray as xr
-import scipy as sc
 import numpy as np
 import typhon.physics as ty
 
-from konrad.cloud import get_aerosol_waveband_data_array
+from konrad import constants
+from konrad.cloud import Cloud, get_aerosol_waveband_data_array
+
+
+def _load_forcing(path, varname):
+    """Read an aerosol forcing variable and its altitude grid.
+
+    The result is cached so that repeated instantiation of aerosol
+    components (e.g. in parameter sweeps) does not re-read the same file.
+    A file that is modified on disk is read again. The returned arrays are
+    shared and therefore read-only. The values are stored in single
+    precision to reduce the memory footprint of the cache; the interpolated
+    profiles are computed in double precision.
+
+    Parameters:
+        path (str): Path to the netCDF file.
+        varname (str): Name of the variable to read.
+
+    Returns:
+        ndarray, ndarray: Altitude [km] and values with shape
+            (bands, altitude).
+    """
+    # Normalize the path so that different spellings of the same file
+    # (relative, absolute, symlinked) share one cache entry. Modification
+    # time and size are part of the key to detect files rewritten in-place.
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+
+    return _read_forcing(path, stat.st_mtime_ns, stat.st_size, varname)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_forcing(path, mtime_ns, size, varname):
+    """Read and cache an aerosol forcing variable, see :func:`_load_forcing`.
+
+    ``mtime_ns`` and ``size`` are not used for reading; they only
+    invalidate the cache entry when the file changes.
+    """
+    with xr.open_dataset(path) as dataset:
+        altitude = dataset["altitude"].values
+        # bring the altitude dimension last, independent of the file layout,
+        # and store the bands as contiguous rows
+        values = dataset[varname].transpose(..., "altitude").values
+        values = np.ascontiguousarray(values, dtype=np.float32)
+
+    altitude.flags.writeable = False
+    values.flags.writeable = False
+
+    return altitude, values
+
+
+@functools.lru_cache(maxsize=32)
+def _height_levels(plev_bytes, T_bytes):
+    """Compute geometric heights [km] from pressure and temperature profiles.
+
+    The profiles are passed as raw float64 bytes so that the result can be
+    cached for repeated use of the same atmospheric state.
+
+    Parameters:
+        plev_bytes (bytes): Pressure levels [Pa].
+        T_bytes (bytes): Temperature profile [K].
+
+    Returns:
+        ndarray: Read-only height levels [km].
+    """
+    plev = np.frombuffer(plev_bytes, dtype=np.float64)
+    T = np.frombuffer(T_bytes, dtype=np.float64)
+
+    heights = ty.pressure2height(plev, T) / 1000
+    heights.flags.writeable = False
+
+    return heights
+
+
+def _layer_thickness(phlev, T):
+    """Compute the thickness of the model layers using the hypsometric equation.
+
+    Parameters:
+        phlev (ndarray): Pressure at half-levels [Pa].
+        T (ndarray): Temperature at full-levels [K].
+
+    Returns:
+        ndarray: Layer thickness [km].
+    """
+    Rd = constants.specific_gas_constant_dry_air
+    g = constants.earth_standard_gravity
+
+    return Rd * T / g * np.log(phlev[:-1] / phlev[1:]) / 1000
+
+
+def _bracket(altitude, heights):
+    """Compute linear interpolation weights from an altitude grid to heights.
+
+    The result only depends on the grids and can be reused for all
+    variables given on the same altitude grid.
+
+    Parameters:
+        altitude (ndarray): Altitude of the input data [km], either
+            ascending or descending.
+        heights (ndarray): Heights to interpolate to [km].
+
+    Returns:
+        tuple: Indices of the lower and upper neighbours and their weights.
+            The weights are zero for heights outside of the altitude range.
+    """
+    descending = altitude[0] > altitude[-1]
+    if descending:
+        altitude = altitude[::-1]
+
+    upper = np.searchsorted(altitude, heights).clip(1, altitude.size - 1)
+    lower = upper - 1
+    x0 = altitude[lower]
+    x1 = altitude[upper]
+    w_upper = (heights - x0) / (x1 - x0)
+    w_lower = 1 - w_upper
+
+    outside = (heights < altitude[0]) | (heights > altitude[-1])
+    w_lower[outside] = 0
+    w_upper[outside] = 0
+
+    if descending:
+        lower = altitude.size - 1 - lower
+        upper = altitude.size - 1 - upper
+
+    return lower, upper, w_lower, w_upper
+
+
+def _interp_bands(values, bracket, scaling=None, out=None):
+    """Linearly interpolate banded aerosol data to the given heights.
+
+    All bands are interpolated at once.
+
+    Parameters:
+        values (ndarray): Input data with shape (bands, altitude).
+        bracket (tuple): Interpolation indices and weights as returned by
+            :func:`_bracket`.
+        scaling (ndarray): Optional factor per height that is applied to
+            the interpolated values.
+        out (ndarray): Optional array with shape (bands, heights) to store
+            the result in.
+
+    Returns:
+        ndarray: Interpolated data with shape (bands, heights).
+    """
+    lower, upper, w_lower, w_upper = bracket
+
+    # Fold the scaling into the interpolation weights, which are only
+    # one-dimensional, instead of rescaling the full output.
+    if scaling is not None:
+        w_lower = w_lower * scaling
+        w_upper = w_upper * scaling
+
+    out = np.multiply(values[:, lower], w_lower, out=out)
+    out += values[:, upper] * w_upper
+
+    return out
 
 
 class Aerosol(metaclass=abc.ABCMeta):
@@ -103,22 +258,113 @@ class Aerosol(metaclass=abc.ABCMeta):
         self.aerosol_level_shift = aerosol_level_shift
         self.include_scattering = include_scattering
         self.include_absorption = include_absorption
-        self.optical_thickness_due_to_aerosol_sw = get_aerosol_waveband_data_array(
-            0, units="dimensionless", numlevels=numlevels, sw=True
-        )  # called ext_sw in files
-        self.single_scattering_albedo_aerosol_sw = get_aerosol_waveband_data_array(
-            0, units="dimensionless", numlevels=numlevels, sw=True
-        )  # called omega_sw in files
-        self.asymmetry_factor_aerosol_sw = get_aerosol_waveband_data_array(
-            0, units="dimensionless", numlevels=numlevels, sw=True
-        )  # called g_sw in files
-        self.optical_thickness_due_to_aerosol_lw = get_aerosol_waveband_data_array(
-            0, units="dimensionless", numlevels=numlevels, sw=False
-        )  # called ext_lw in files
+
+    # The radiative properties are zero-initialized on first access. This
+    # avoids allocating them for aerosol types that are never read, e.g.
+    # "no_aerosol", which is skipped by the radiation scheme.
+    @functools.cached_property
+    def _sw_block(self):
+        """Contiguous storage for the SW extinction, single scattering albedo
+        and asymmetry factor, with shape (3, bands, levels)."""
+        return np.zeros((3, Cloud.num_shortwave_bands, self.numlevels))
+
+    def _sw_data_array(self, index):
+        """Return a SW property as DataArray sharing memory with the block."""
+        return get_aerosol_waveband_data_array(
+            self._sw_block[index].T,
+            units="dimensionless",
+            numlevels=self.numlevels,
+            sw=True,
+        )
+
+    @functools.cached_property
+    def optical_thickness_due_to_aerosol_sw(self):
+        """Called ext_sw in files."""
+        return self._sw_data_array(0)
+
+    @functools.cached_property
+    def single_scattering_albedo_aerosol_sw(self):
+        """Called omega_sw in files."""
+        return self._sw_data_array(1)
+
+    @functools.cached_property
+    def asymmetry_factor_aerosol_sw(self):
+        """Called g_sw in files."""
+        return self._sw_data_array(2)
+
+    @functools.cached_property
+    def optical_thickness_due_to_aerosol_lw(self):
+        """Called ext_lw in files."""
+        return get_aerosol_waveband_data_array(
+            0, units="dimensionless", numlevels=self.numlevels, sw=False
+        )
 
     def calculate_height_levels(self, atmosphere):
         return
 
+    def _apply_forcing(self, atmosphere, shift=0):
+        """Read the aerosol radiative properties from the forcing files and
+        interpolate them to the model levels.
+
+        Parameters:
+            atmosphere (konrad.atmosphere): Corresponding atmosphere instance
+            shift (float): shift of the aerosol layer relative to the
+                original aerosol layer (units in km)
+        """
+        if not (self.include_lw_forcing or self.include_sw_forcing):
+            return
+
+        # the input data has to be scaled to fit to model levels
+        # for compatability with rrtmg input format: the extinction [km^-1]
+        # is converted to an optical thickness of each layer
+        heights = self.calculate_height_levels(atmosphere)
+        scaling = _layer_thickness(atmosphere["phlev"], atmosphere["T"][0, :])
+
+        # the interpolation weights are shared by all files on the same grid
+        bracket_altitude, bracket = None, None
+
+        # switch: toggle inclusion of this radiative property
+        # rrtmg_key: RRTMG accesses the radiative property by this name
+        # file: where to read it from
+        # bands: name of the band coordinate in the file
+        # filevarname: name of the variable to read from the file
+        for switch, rrtmg_key, file, bands, filevarname in zip(
+            [
+                self.include_lw_forcing,
+                self.include_sw_forcing,
+                self.include_sw_forcing,
+                self.include_sw_forcing,
+            ],
+            [
+                "optical_thickness_due_to_aerosol_lw",
+                "optical_thickness_due_to_aerosol_sw",
+                "asymmetry_factor_aerosol_sw",
+                "single_scattering_albedo_aerosol_sw",
+            ],
+            [self.file_ext_lw, self.file_ext_sw, self.file_g_sw, self.file_omega_sw],
+            ["terrestrial_bands", "solar_bands", "solar_bands", "solar_bands"],
+            ["ext_earth", "ext_sun", "g_sun", "omega_sun"],
+        ):
+            if switch:
+                # read ext, g, omega files if the respective switches are set True
+                altitude, values = _load_forcing(file, filevarname)
+                # shift in height (not in-place, the cached data is shared)
+                if shift:
+                    altitude = altitude + shift
+                if not np.array_equal(altitude, bracket_altitude):
+                    bracket_altitude = altitude
+                    bracket = _bracket(altitude, heights)
+                # set values of dataset to values read from the file, interpolated
+                # to pressure levels
+                # and scale extinction by scaling factor
+                is_extinction = rrtmg_key.startswith("optical_thickness")
+                _interp_bands(
+                    values,
+                    bracket,
+                    scaling=scaling if is_extinction else None,
+                    out=getattr(self, rrtmg_key).values,
+                )
+
 
 class VolcanoAerosol(Aerosol):
     """
@@ -163,8 +409,22 @@ class VolcanoAerosol(Aerosol):
                 scattering / absorption component.
                 (only for "all_aerosol_properties")
         """
+        if not (include_scattering or include_absorption):
+            raise ValueError("Scattering and absorption cannot both be deactivated.")
+
+        # if no files specified, load default files
+        datadir = os.path.join(os.path.dirname(__file__), "data", "Aerosol")
+        if file_ext_lw is None:
+            file_ext_lw = os.path.join(datadir, "EVA_10Tg_ext_lw_1991-09.nc")
+        if file_ext_sw is None:
+            file_ext_sw = os.path.join(datadir, "EVA_10Tg_ext_sw_1991-09.nc")
+        if file_g_sw is None:
+            file_g_sw = os.path.join(datadir, "EVA_10Tg_g_sw_1991-09.nc")
+        if file_omega_sw is None:
+            file_omega_sw = os.path.join(datadir, "EVA_10Tg_omega_sw_1991-09.nc")
+
         super().__init__(
-            numlevels=np.size(atmosphere.coords["plev"]),
+            numlevels=atmosphere["plev"].size,
             aerosol_type="all_aerosol_properties",
             file_ext_lw=file_ext_lw,
             file_ext_sw=file_ext_sw,
@@ -177,170 +437,26 @@ class VolcanoAerosol(Aerosol):
             include_absorption=include_absorption,
         )
 
-        # if no files specified, load default files
-        for attr, attr_name, defaultfile in zip(
-            [file_ext_lw, file_ext_sw, file_g_sw, file_omega_sw],
-            ["file_ext_lw", "file_ext_sw", "file_g_sw", "file_omega_sw"],
-            [
-                os.path.join(
-                    os.path.dirname(__file__),
-                    "data",
-                    "Aerosol",
-                    "EVA_10Tg_ext_lw_1991-09.nc",
-                ),
-                os.path.join(
-                    os.path.dirname(__file__),
-                    "data",
-                    "Aerosol",
-                    "EVA_10Tg_ext_sw_1991-09.nc",
-                ),
-                os.path.join(
-                    os.path.dirname(__file__),
-                    "data",
-                    "Aerosol",
-                    "EVA_10Tg_g_sw_1991-09.nc",
-                ),
-                os.path.join(
-                    os.path.dirname(__file__),
-                    "data",
-                    "Aerosol",
-                    "EVA_10Tg_omega_sw_1991-09.nc",
-                ),
-            ],
-        ):
-            if attr is None:
-                self.__setattr__(attr_name, defaultfile)
+        self._apply_forcing(atmosphere, shift=self.aerosol_level_shift)
 
-        # the input data has to be scaled to fit to model levels
-        # for compatability with rrtmg input format
-        heights = self.calculate_height_levels(atmosphere)
-        scaling = np.gradient(heights)
-
-        # switch: toggle inclusion of this radiative property
-        # rrtmg_key: RRTMG accesses the radiative property by this name
-        # file: where to read it from
-        # bands: name of the band coordinate in the file
-        # filevarname: name of the variable to read from the file
-        for switch, rrtmg_key, file, bands, filevarname in zip(
-            [
-                self.include_lw_forcing,
-                self.include_sw_forcing,
-                self.include_sw_forcing,
-                self.include_sw_forcing,
-            ],
-            [
-                "optical_thickness_due_to_aerosol_lw",
-                "optical_thickness_due_to_aerosol_sw",
-                "asymmetry_factor_aerosol_sw",
-                "single_scattering_albedo_aerosol_sw",
-            ],
-            [self.file_ext_lw, self.file_ext_sw, self.file_g_sw, self.file_omega_sw],
-            ["terrestrial_bands", "solar_bands", "solar_bands", "solar_bands"],
-            ["ext_earth", "ext_sun", "g_sun", "omega_sun"],
-        ):
-            if switch:
-                # read ext, g, omega files if the respective switches are set True
-                with xr.open_dataset(file) as dataset:
-                    # shift in height
-                    if self.aerosol_level_shift:
-                        self.aerosol_level_shift_array = (
-                            self.aerosol_level_shift
-                            * np.ones(np.shape(dataset.altitude[:]))
-                        )
-                        dataset = dataset.assign_coords(
-                            {
-                                "altitude": dataset.altitude
-                                + self.aerosol_level_shift_array
-                            }
-                        )
-                    # set values of dataset to values read from the file, interpolated
-                    # to pressure levels
-                    getattr(self, rrtmg_key).values = sc.interpolate.interp1d(
-                        dataset.altitude,
-                        dataset[filevarname],
-                        bounds_error=False,
-                        fill_value=0,
-                    )(heights)
-                # scale extinction by scaling factor
-                if rrtmg_key in [
-                    "optical_thickness_due_to_aerosol_lw",
-                    "optical_thickness_due_to_aerosol_sw",
-                ]:
-                    getattr(self, rrtmg_key).values *= scaling
-
-            if not self.include_scattering:
-                # only absorption: omega'=0, ext'=ext*(1-omega)"""
-                try:
-                    a = get_aerosol_waveband_data_array(
-                        1, units="dimensionless", numlevels=self.numlevels, sw=True
-                    )
-                    result = (
-                        np.multiply(
-                            self.optical_thickness_due_to_aerosol_sw,
-                            np.subtract(a, self.single_scattering_albedo_aerosol_sw),
-                        ),
-                    )
-
-                    self.optical_thickness_due_to_aerosol_sw = (
-                        get_aerosol_waveband_data_array(
-                            result[0].values.T,
-                            units="dimensionless",
-                            numlevels=self.numlevels,
-                            sw=True,
-                        )
-                    )
-                    self.single_scattering_albedo_aerosol_sw = (
-                        get_aerosol_waveband_data_array(
-                            0,
-                            units="dimensionless",
-                            numlevels=self.numlevels,
-                            sw=True,
-                        )
-                    )
-                    if not self.include_absorption:
-                        raise ValueError(
-                            "Scattering and absorption cannot both be deactivated."
-                        )
-                except ValueError:
-                    exit("Please choose valid input data.")
-
-            if not self.include_absorption:
-                # only scattering: omega'=1, ext'=ext*omega"""
-                try:
-                    result = np.multiply(
-                        self.optical_thickness_due_to_aerosol_sw,
-                        self.single_scattering_albedo_aerosol_sw,
-                    )
-                    self.optical_thickness_due_to_aerosol_sw = (
-                        get_aerosol_waveband_data_array(
-                            result[0].values.T,
-                            units="dimensionless",
-                            numlevels=self.numlevels,
-                            sw=True,
-                        )
-                    )
-                    self.single_scattering_albedo_aerosol_sw = (
-                        get_aerosol_waveband_data_array(
-                            1,
-                            units="dimensionless",
-                            numlevels=self.numlevels,
-                            sw=True,
-                        )
-                    )
-
-                    if not self.include_scattering:
-                        raise ValueError(
-                            "Scattering and absorption cannot both be deactivated."
-                        )
-                except ValueError:
-                    exit("Please choose valid input data.")
+        ext_sw = self.optical_thickness_due_to_aerosol_sw.values
+        ssa_sw = self.single_scattering_albedo_aerosol_sw.values
+        if not self.include_scattering:
+            # only absorption: omega'=0, ext'=ext*(1-omega)
+            ext_sw *= 1 - ssa_sw
+            ssa_sw[...] = 0
+        elif not self.include_absorption:
+            # only scattering: omega'=1, ext'=ext*omega
+            ext_sw *= ssa_sw
+            ssa_sw[...] = 1
 
     def calculate_height_levels(self, atmosphere):
         """Used to translate the aerosol forcing data given as a function of height
         to aerosol forcing data as a function of pressure levels
         """
-        heights = ty.pressure2height(atmosphere["plev"], atmosphere["T"][0, :]) / 1000
-        return heights
+        plev = np.ascontiguousarray(atmosphere["plev"], dtype=np.float64)
+        T = np.ascontiguousarray(atmosphere["T"][0, :], dtype=np.float64)
+        return _height_levels(plev.tobytes(), T.tobytes())
 
 
 class NoAerosol(Aerosol):
@@ -353,9 +469,7 @@ class NoAerosol(Aerosol):
         Parameters:
             atmosphere: Pass the corresponding atmosphere instance of the RCE.
         """
-        super().__init__(
-            numlevels=np.size(atmosphere.coords["plev"]), aerosol_type="no_aerosol"
-        )
+        super().__init__(numlevels=atmosphere["plev"].size, aerosol_type="no_aerosol")
 
     def calculate_height_levels(self, atmosphere):
         return
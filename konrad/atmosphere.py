@@ -333,10 +333,11 @@ class Atmosphere(Component):
         Returns:
             int: Model level index at the cold point.
         """
-        plev = self["plev"][:]
-        T = np.ma.masked_array(self["T"][-1, :], plev < self.pmin)
+        plev = self["plev"]
+        T = self["T"][-1, :]
 
-        return np.argmin(T)
+        # Exclude levels above ``pmin`` from the search.
+        return int(np.argmin(np.where(plev < self.pmin, np.inf, T)))
 
     def get_cold_point_plev(self, interpolate=False):
         """Return the cold point pressure.
@@ -379,24 +380,26 @@ class Atmosphere(Component):
             return self["plev"][self.get_cold_point_index()]
 
     def get_tropopause_index_wmo(self, raise_error=True):
-        self.calculate_height()
         height = self["z"][-1, :] / 1000
         lapse_rate = self.get_lapse_rates() * (-1000)
         height_diffs = np.diff(height)
         height_diffs = np.insert(height_diffs, 0, 0)
-        for i in np.ma.masked_array(height, (lapse_rate > 2)).nonzero()[0]:
-            current_height = height[i]
-            test_height = np.ma.masked_outside(
-                height, current_height, current_height + 2.5
+
+        # Average the lapse rate over the layer [z, z + 2.5 km] above every
+        # level. Cumulative sums of the (weighted) lapse rate allow to compute
+        # all layer averages at once instead of looping over the levels.
+        cum_weights = np.concatenate(([0.0], np.cumsum(height_diffs)))
+        cum_lapse_rate = np.concatenate(([0.0], np.cumsum(lapse_rate * height_diffs)))
+        layer_top = np.searchsorted(height, height + 2.5, side="right")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            layer_average = (cum_lapse_rate[layer_top] - cum_lapse_rate[:-1]) / (
+                cum_weights[layer_top] - cum_weights[:-1]
             )
 
-            if (
-                np.ma.average(
-                    np.ma.masked_array(lapse_rate, test_height.mask),
-                    weights=height_diffs,
-                )
-            ) < 2 and (i > 0):
-                return i
+        is_tropopause = (lapse_rate <= 2) & (height != 0) & (layer_average < 2)
+        is_tropopause[0] = False
+        if np.any(is_tropopause):
+            return int(np.argmax(is_tropopause))
         if raise_error:
             raise RuntimeError("No WMO tropopause found.")
         else:
@@ -163,16 +163,22 @@ class OzoneRedistributed(Ozone):
         T = atmosphere["T"][0, :]
         lapse_rate_K_per_km = np.gradient(T, z)
 
-        mask1 = np.where(lapse_rate_K_per_km > -2)[0]
-        thermal_tropopause = False
-        i = 0
-        while not thermal_tropopause:
-            index = mask1[i]
-            limit_test = np.where(z - z[index] >= 2)[0][0]
-            region = lapse_rate_K_per_km[index : limit_test + 1]
-            if np.all(region >= -2):
-                thermal_tropopause = index
-            i += 1
+        # The thermal tropopause is the lowest level (above the surface) from
+        # which the lapse rate stays above -2 K/km for at least 2 km.
+        # Counting the levels violating this criterion cumulatively allows to
+        # check the 2 km layers above all levels at once.
+        cum_unstable = np.concatenate(([0], np.cumsum(lapse_rate_K_per_km < -2)))
+        layer_top = np.searchsorted(z, z + 2)
+        is_tropopause = (
+            (lapse_rate_K_per_km > -2)
+            & (layer_top < z.size)
+            & (cum_unstable[np.minimum(layer_top + 1, z.size)] == cum_unstable[:-1])
+        )
+        is_tropopause[0] = False
+
+        if not np.any(is_tropopause):
+            raise RuntimeError("No thermal tropopause found.")
+        thermal_tropopause = int(np.argmax(is_tropopause))
 
         ozone_tropopause = np.where(z - z[thermal_tropopause] > -1)[0][0]
         ozone_tropopause_sub = np.where(z - z[ozone_tropopause] > -2)[0][0]
@@ -253,6 +259,8 @@ class Cariolle(Ozone):
         else:
             self.w = None
         self._is_coupled_upwelling = is_coupled_upwelling
+        self._params = None
+        self._params_plev = None
 
     def ozone_transport(self, o3, z, upwelling):
         """Rate of change of ozone is calculated based on the ozone gradient
@@ -284,15 +292,29 @@ class Cariolle(Ozone):
         return -w_array * do3dz
 
     def get_params(self, p):
-        cariolle_data = Dataset(
-            os.path.join(os.path.dirname(__file__), "data/Cariolle_data.nc")
-        )
-        p_data = cariolle_data["p"][:]
-        alist = []
-        for param_num in range(1, 8):
-            a = cariolle_data[f"A{param_num}"][:]
-            alist.append(interp1d(p_data, a, fill_value="extrapolate")(p))
-        return alist
+        """Return the Cariolle parameters A1 to A7 on the given pressure grid.
+
+        The parameters are read from file only once and cached as long as
+        the pressure grid does not change.
+
+        Parameters:
+            p (ndarray): pressure levels [Pa]
+        Returns:
+            list of ndarrays: interpolated parameters A1 to A7
+        """
+        if self._params is None or not np.array_equal(self._params_plev, p):
+            with Dataset(
+                os.path.join(os.path.dirname(__file__), "data/Cariolle_data.nc")
+            ) as cariolle_data:
+                p_data = cariolle_data["p"][:]
+                alist = []
+                for param_num in range(1, 8):
+                    a = cariolle_data[f"A{param_num}"][:]
+                    alist.append(interp1d(p_data, a, fill_value="extrapolate")(p))
+            self._params = alist
+            self._params_plev = np.copy(p)
+
+        return self._params
 
     def density_of_molecules(self, p, T):
         """
@@ -77,7 +77,7 @@ def _(temperature):
         e_eq_ice = typ.e_eq_ice_mk(temperature)
         return (
             e_eq_ice
-            + (typ.e_eq_water_mk(temperature) - typ.e_eq_ice_mk(temperature))
+            + (typ.e_eq_water_mk(temperature) - e_eq_ice)
             * ((temperature - constants.triple_point_water + 23) / 23) ** 2
         )
 
@@ -20,6 +20,20 @@ __all__ = [
 ]
 
 
+# CliMT/konrad name mapping of trace gases
+_GAS_NAME_MAPPING = (
+    ("mole_fraction_of_methane_in_air", "CH4"),
+    ("mole_fraction_of_carbon_dioxide_in_air", "CO2"),
+    ("mole_fraction_of_nitrous_oxide_in_air", "N2O"),
+    ("mole_fraction_of_ozone_in_air", "O3"),
+    ("mole_fraction_of_cfc11_in_air", "CFC11"),
+    ("mole_fraction_of_cfc12_in_air", "CFC12"),
+    ("mole_fraction_of_cfc22_in_air", "CFC22"),
+    ("mole_fraction_of_carbon_tetrachloride_in_air", "CCl4"),
+    ("mole_fraction_of_oxygen_in_air", "O2"),
+)
+
+
 class RRTMG(Radiation):
     """RRTMG radiation scheme using the CliMT python wrapper."""
 
@@ -227,6 +241,30 @@ class RRTMG(Radiation):
 
         return
 
+    @staticmethod
+    def _set_profile(state0, name, values, units):
+        """Set a vertical profile in a CliMT formatted state.
+
+        Profiles that are already present are updated in-place to avoid
+        constructing new DataArrays in every timestep. New profiles are
+        stored as a copy so that the state never shares memory with the
+        atmosphere model.
+
+        Parameters:
+            state0 (dictionary): atmospheric state in the format for climt
+            name (str): CliMT name of the quantity
+            values (ndarray): profile on mid levels
+            units (str): units of the quantity
+        """
+        if name in state0:
+            state0[name].values[:] = values
+        else:
+            state0[name] = DataArray(
+                np.array(values, dtype=float),
+                dims=("mid_levels",),
+                attrs={"units": units},
+            )
+
     def update_radiative_state(self, atmosphere, surface, state0, sw=True):
         """Update CliMT formatted atmospheric state using parameters from our
         model.
@@ -241,34 +279,15 @@ class RRTMG(Radiation):
             dictionary: updated state
         """
 
-        state0["air_temperature"] = DataArray(
-            atmosphere["T"][0, :], dims=("mid_levels",), attrs={"units": "degK"}
-        )
+        self._set_profile(state0, "air_temperature", atmosphere["T"][0, :], "degK")
 
         vmr_h2o = atmosphere["H2O"][0, :]
         specific_humidity = vmr2specific_humidity(vmr_h2o)
-        state0["specific_humidity"] = DataArray(
-            specific_humidity, dims=("mid_levels",), attrs={"units": "g/g"}
-        )
+        self._set_profile(state0, "specific_humidity", specific_humidity, "g/g")
 
-        # CliMT/konrad name mapping
-        gas_name_mapping = [
-            ("mole_fraction_of_methane_in_air", "CH4"),
-            ("mole_fraction_of_carbon_dioxide_in_air", "CO2"),
-            ("mole_fraction_of_nitrous_oxide_in_air", "N2O"),
-            ("mole_fraction_of_ozone_in_air", "O3"),
-            ("mole_fraction_of_cfc11_in_air", "CFC11"),
-            ("mole_fraction_of_cfc12_in_air", "CFC12"),
-            ("mole_fraction_of_cfc22_in_air", "CFC22"),
-            ("mole_fraction_of_carbon_tetrachloride_in_air", "CCl4"),
-            ("mole_fraction_of_oxygen_in_air", "O2"),
-        ]
-
-        for climt_key, konrad_key in gas_name_mapping:
+        for climt_key, konrad_key in _GAS_NAME_MAPPING:
             vmr = atmosphere.get(konrad_key, default=0, keepdims=False)
-            state0[climt_key] = DataArray(
-                vmr, dims=("mid_levels",), attrs={"units": "mole/mole"}
-            )
+            self._set_profile(state0, climt_key, vmr, "mole/mole")
 
         # Surface quantities
         state0["surface_temperature"] = DataArray(
@@ -303,9 +322,11 @@ class RRTMG(Radiation):
             self._state_lw, self._state_sw = self.init_radiative_state(
                 atmosphere, surface
             )
-            self.update_aerosol_radiative_properties(
-                aerosol, state_sw=self._state_sw, state_lw=self._state_lw
-            )
+            # the aerosol properties are initialized with zeros in the state
+            if self._aerosol_type != "no_aerosol":
+                self.update_aerosol_radiative_properties(
+                    aerosol, state_sw=self._state_sw, state_lw=self._state_lw
+                )
             self.update_cloudy_radiative_state(cloud, self._state_lw, sw=False)
             self.update_cloudy_radiative_state(cloud, self._state_sw, sw=True)
 
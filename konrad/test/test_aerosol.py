@@ -0,0 +1,196 @@
+import numpy as np
+import pytest
+import typhon.physics
+import xarray as xr
+
+from konrad import aerosol, atmosphere, constants, utils
+
+
+@pytest.fixture
+def atmosphere_obj():
+    _, phlev = utils.get_pressure_grids(surface_pressure=1000e2, num=50)
+
+    return atmosphere.Atmosphere(phlev=phlev)
+
+
+def write_forcing(
+    path, varname, values, altitude, bands_dim="solar_bands", transpose=False
+):
+    """Write a synthetic aerosol forcing file.
+
+    The values are given with shape (bands, altitude) and stored with shape
+    (altitude, bands) if ``transpose`` is set.
+    """
+    data = xr.DataArray(
+        values, dims=(bands_dim, "altitude"), coords={"altitude": altitude}
+    )
+    if transpose:
+        data = data.T
+    data.to_dataset(name=varname).to_netcdf(path)
+
+    return str(path)
+
+
+@pytest.fixture
+def forcing_data():
+    """Synthetic SW forcing on an ascending altitude grid [km]."""
+    rng = np.random.default_rng(0)
+    altitude = np.sort(rng.uniform(5, 35, size=30))
+    values = rng.random((14, altitude.size)).astype(np.float32)
+
+    return altitude, values
+
+
+@pytest.fixture
+def forcing_files(tmp_path):
+    """Synthetic forcing files for all aerosol radiative properties."""
+    rng = np.random.default_rng(1)
+    altitude = np.linspace(0, 40, 41)
+    profile = np.exp(-(((altitude - 20) / 5) ** 2))
+
+    files = {}
+    for name, varname, bands_dim, numbands, low in [
+        ("ext_lw", "ext_earth", "terrestrial_bands", 16, 0),
+        ("ext_sw", "ext_sun", "solar_bands", 14, 0),
+        ("g_sw", "g_sun", "solar_bands", 14, 0),
+        ("omega_sw", "omega_sun", "solar_bands", 14, 0.5),
+    ]:
+        values = rng.uniform(low, 1, size=(numbands, 1))
+        if name.startswith("ext"):
+            values = values * profile
+        else:
+            values = np.repeat(values, altitude.size, axis=1)
+        files[f"file_{name}"] = write_forcing(
+            tmp_path / f"{name}.nc", varname, values, altitude, bands_dim
+        )
+
+    return files
+
+
+def interp_reference(altitude, values, heights):
+    """Interpolate every band separately with zero fill outside the range."""
+    return np.stack([np.interp(heights, altitude, v, left=0, right=0) for v in values])
+
+
+class TestAerosol:
+    def test_no_aerosol(self, atmosphere_obj):
+        """Test that no aerosol does not interact with radiation."""
+        no_aerosol = aerosol.NoAerosol(atmosphere_obj)
+
+        assert not np.any(no_aerosol.optical_thickness_due_to_aerosol_sw)
+        assert not np.any(no_aerosol.optical_thickness_due_to_aerosol_lw)
+
+    def test_no_scattering_and_no_absorption(self, atmosphere_obj):
+        """Test that scattering and absorption cannot both be deactivated."""
+        with pytest.raises(ValueError):
+            aerosol.VolcanoAerosol(
+                atmosphere_obj,
+                include_scattering=False,
+                include_absorption=False,
+            )
+
+    def test_forcing_cache_detects_modified_file(self, tmp_path):
+        """Test that a forcing file rewritten on disk is read again."""
+        path = tmp_path / "forcing.nc"
+        altitude = np.linspace(0, 40, 5)
+
+        write_forcing(path, "ext_sun", np.full((14, 5), 1.0), altitude)
+        assert np.all(aerosol._load_forcing(str(path), "ext_sun")[1] == 1.0)
+
+        write_forcing(path, "ext_sun", np.full((14, 6), 7.0), np.arange(6.0))
+        assert np.all(aerosol._load_forcing(str(path), "ext_sun")[1] == 7.0)
+
+    @pytest.mark.parametrize("descending", [False, True])
+    @pytest.mark.parametrize("transpose", [False, True])
+    def test_interp_bands(self, tmp_path, forcing_data, descending, transpose):
+        """Test the band interpolation of forcing files against np.interp."""
+        altitude, values = forcing_data
+        order = slice(None, None, -1) if descending else slice(None)
+        path = write_forcing(
+            tmp_path / "forcing.nc",
+            "ext_sun",
+            values[:, order],
+            altitude[order],
+            transpose=transpose,
+        )
+
+        file_altitude, file_values = aerosol._load_forcing(path, "ext_sun")
+        assert file_values.shape == values.shape
+
+        # Heights below, above and exactly at the ends of the altitude grid.
+        heights = np.concatenate(
+            [np.linspace(0, 40, 81), altitude[[0, -1]], altitude[[1, -2]]]
+        )
+        bracket = aerosol._bracket(file_altitude, heights)
+        reference = interp_reference(altitude, values, heights)
+
+        result = aerosol._interp_bands(file_values, bracket)
+        assert np.allclose(result, reference, rtol=1e-12, atol=0)
+
+        outside = (heights < altitude[0]) | (heights > altitude[-1])
+        assert np.any(outside)
+        assert not np.any(result[:, outside])
+
+        scaling = np.linspace(0.5, 2, heights.size)
+        out = np.empty((values.shape[0], heights.size))
+        result = aerosol._interp_bands(file_values, bracket, scaling, out=out)
+        assert result is out
+        assert np.allclose(out, reference * scaling, rtol=1e-12, atol=0)
+
+    @pytest.mark.parametrize(
+        "switch, expected_ssa",
+        [("include_absorption", 1), ("include_scattering", 0)],
+    )
+    def test_scattering_or_absorption_only(
+        self, atmosphere_obj, forcing_files, switch, expected_ssa
+    ):
+        """Test that SW extinction is reduced to scattering or absorption."""
+        full = aerosol.VolcanoAerosol(atmosphere_obj, **forcing_files)
+        ext_full = full.optical_thickness_due_to_aerosol_sw.values
+        omega = full.single_scattering_albedo_aerosol_sw.values
+
+        partial = aerosol.VolcanoAerosol(
+            atmosphere_obj, **forcing_files, **{switch: False}
+        )
+        ext = partial.optical_thickness_due_to_aerosol_sw.values
+        ssa = partial.single_scattering_albedo_aerosol_sw.values
+
+        # scattering only: ext' = ext * omega, absorption only:
+        # ext' = ext * (1 - omega), per band
+        fraction = omega if expected_ssa == 1 else 1 - omega
+        assert np.any(ext_full)
+        assert not np.allclose(fraction, fraction[0])
+        assert np.allclose(ext, ext_full * fraction, rtol=1e-12, atol=0)
+        assert np.all(ssa == expected_ssa)
+
+    def test_layer_thickness_isothermal(self, atmosphere_obj):
+        """Test that isothermal layer thicknesses add up to the column depth."""
+        phlev = atmosphere_obj["phlev"]
+        T = 250.0
+
+        dz = aerosol._layer_thickness(phlev, np.full(phlev.size - 1, T))
+
+        # closed-form hypsometric depth [km] of an isothermal column
+        Rd = constants.specific_gas_constant_dry_air
+        g = constants.earth_standard_gravity
+        depth = Rd * T / g * np.log(phlev[0] / phlev[-1]) / 1000
+
+        assert np.all(dz > 0)
+        assert np.isclose(dz.sum(), depth, rtol=1e-12, atol=0)
+
+    def test_layer_thickness(self, atmosphere_obj):
+        """Test layer thicknesses against a hydrostatic height integration."""
+        phlev = atmosphere_obj["phlev"]
+        plev = atmosphere_obj["plev"]
+        T = atmosphere_obj["T"][0, :]
+
+        dz = aerosol._layer_thickness(phlev, T)
+
+        # independent reference: integrate the hydrostatic equation on the
+        # half-levels with temperatures interpolated in log-pressure
+        T_half = np.interp(np.log(phlev), np.log(plev[::-1]), T[::-1])
+        reference = np.diff(typhon.physics.pressure2height(phlev, T_half)) / 1000
+
+        assert np.all(dz > 0)
+        assert np.allclose(dz, reference, rtol=0.02, atol=0)
+        assert np.isclose(dz.sum(), reference.sum(), rtol=0.01, atol=0)
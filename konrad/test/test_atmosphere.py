@@ -30,6 +30,10 @@ class TestAtmosphere:
         """Test retrieval of the triple point index."""
         assert atmosphere_obj.get_triple_point_index() == 2
 
+    def test_tropopause_index_wmo(self, atmosphere_obj):
+        """Test retrieval of the WMO tropopause index."""
+        assert atmosphere_obj.get_tropopause_index_wmo() == 11
+
     def test_cold_point_plev(self, atmosphere_obj):
         """Test retrieval of the cold point pressure."""
         assert np.isclose(atmosphere_obj.get_cold_point_plev(), 19611.012)
@@ -23,6 +23,17 @@ from konrad.component import Component
 from konrad.constants import meters_per_day
 
 
+# Brewer-Dobson circulation velocities from three reanalyses shown in
+# Abalos et al. (2015), used in :func:`bdc_profile`.
+_BDC_PLEV = np.array([100, 80, 70, 60, 50, 40, 30, 20, 10]) * 100  # [Pa]
+_BDC_PLEV.setflags(write=False)
+_BDC_VELOCITY = (
+    np.array([0.28, 0.24, 0.23, 0.225, 0.225, 0.24, 0.27, 0.32, 0.42])
+    * meters_per_day
+)  # [m / day]
+_BDC_VELOCITY.setflags(write=False)
+
+
 def cooling_rates(T, z, w, Cp, base_level):
     """Get cooling rates associated with the upwelling velocity w.
 
@@ -36,10 +47,12 @@ def cooling_rates(T, z, w, Cp, base_level):
     Returns:
         ndarray: heating rate profile [K/day]
     """
-    dTdz = np.gradient(T, z)
-
     g = constants.g
-    Q = -w * (dTdz + g / Cp)
+
+    # Q = -w * (dT/dz + g / Cp), computed in-place on the temperature gradient.
+    Q = np.gradient(T, z)
+    Q += g / Cp
+    Q *= -w
     Q[:base_level] = 0
 
     return Q
@@ -60,14 +73,9 @@ def bdc_profile(norm_level):
         callable: Brewer-Dobson circulation velocity [m / day] as a function
             of pressure [Pa]
     """
-    p = np.array([100, 80, 70, 60, 50, 40, 30, 20, 10]) * 100  # [Pa]
-    bdc = (
-        np.array([0.28, 0.24, 0.23, 0.225, 0.225, 0.24, 0.27, 0.32, 0.42])
-        * meters_per_day
-    )  # [m / day]
     f = interp1d(
-        np.log(p / norm_level),
-        bdc,
+        np.log(_BDC_PLEV / norm_level),
+        _BDC_VELOCITY,
         fill_value=(0.42 * meters_per_day, 0.28 * meters_per_day),
         bounds_error=False,
         kind="quadratic",
@@ -143,7 +151,7 @@ class StratosphericUpwelling(Upwelling):
 
         Q = cooling_rates(T, z, self._w, Cp, above_level_index)
 
-        atmosphere["T"][0, :] += Q * timestep
+        T += Q * timestep
 
         self["cooling_rates"] = (("time", "plev"), -Q.reshape(1, -1))
 
@@ -192,6 +200,8 @@ class CoupledUpwelling(StratosphericUpwelling):
             convection (konrad.convection): Convection model.
             timestep (float): Timestep width [day].
         """
+        plev = atmosphere["plev"]
+
         if self._norm_plev is None:  # first time only and if not specified
             above_level_index = convection.get("convective_top_index")[0]
             if np.isnan(above_level_index):
@@ -199,21 +209,21 @@ class CoupledUpwelling(StratosphericUpwelling):
                     "No convective top found and no input normalisation level "
                     "for the coupled upwelling."
                 )
-            self._norm_plev = atmosphere["plev"][above_level_index]
+            self._norm_plev = plev[above_level_index]
 
         if self._f is None:  # first time only
             self._f = bdc_profile(self._norm_plev)
 
         above_level_index = convection.get("convective_top_index")[0]
-        norm_plev = atmosphere["plev"][above_level_index]
-        self._w = self._f(np.log(atmosphere["plev"] / norm_plev))
+        norm_plev = plev[above_level_index]
+        self._w = self._f(np.log(plev / norm_plev))
 
         T = atmosphere["T"][0, :]
         z = atmosphere["z"][0, :]
         Cp = atmosphere.get_heat_capacity()
         Q = cooling_rates(T, z, self._w, Cp, above_level_index)
 
-        atmosphere["T"][0, :] += Q * timestep
+        T += Q * timestep
 
         self["w"] = (("time", "plev"), self._w.reshape(1, -1))
         self["cooling_rates"] = (("time", "plev"), -Q.reshape(1, -1))
@@ -398,9 +398,9 @@ def calculate_combined_weights(weights):
     """Calculate combined probabilities for a set of single probabilities."""
     binary_table = np.array(list(itertools.product([False, True], repeat=len(weights))))
 
-    pij = np.zeros_like(binary_table, dtype=float)
-    for (i, j), is_cloudy in np.ndenumerate(binary_table):
-        pij[i, j] = 1 - is_cloudy + (2 * is_cloudy - 1) * weights[j]
+    # Probability of each cloud being present (w) or absent (1 - w).
+    weights = np.asarray(weights, dtype=float)
+    pij = np.where(binary_table, weights, 1 - weights)
 
     return binary_table, np.prod(pij, axis=1)
 
@@ -434,8 +434,10 @@ def dp_from_dz(dz, p, T):
 
 def find_first_below(arr, val):
     """Find first index in `arr` that falls below given `val`."""
-    for n, x in np.ndenumerate(arr):
-        if x <= val:
-            return n
+    arr = np.asarray(arr)
+    is_below = np.ravel(arr <= val)
 
-    return n
+    # Return the last index if no value falls below the given threshold.
+    n = np.argmax(is_below) if np.any(is_below) else is_below.size - 1
+
+    return tuple(int(i) for i in np.unravel_index(n, arr.shape))